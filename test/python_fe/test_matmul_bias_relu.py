@@ -5,21 +5,19 @@ import torch
 
 from test_utils import torch_fork_set_rng
 
+_torch_to_cudnn_type = {
+    torch.float16: cudnn.data_type.HALF,
+    torch.bfloat16: cudnn.data_type.BFLOAT16,
+    torch.float32: cudnn.data_type.FLOAT,
+    torch.bool: cudnn.data_type.BOOLEAN,
+    torch.uint8: cudnn.data_type.UINT8,
+    torch.int8: cudnn.data_type.INT8,
+}
+
 def convert_to_cudnn_type(torch_type):
-    if torch_type == torch.float16:
-        return cudnn.data_type.HALF
-    elif torch_type == torch.bfloat16:
-        return cudnn.data_type.BFLOAT16
-    elif torch_type == torch.float32:
-        return cudnn.data_type.FLOAT
-    elif torch_type == torch.bool:
-        return cudnn.data_type.BOOLEAN
-    elif torch_type == torch.uint8:
-        return cudnn.data_type.UINT8
-    elif torch_type == torch.int8:
-        return cudnn.data_type.INT8
-    else:
+    if torch_type not in _torch_to_cudnn_type:
         raise ValueError("Unsupported tensor data type.")
+    return _torch_to_cudnn_type[torch_type]
     
 def get_cc():
     (major, minor) = torch.cuda.get_device_capability()
@@ -23,19 +23,18 @@ is_infer_options = [False, True]
 def arg_params(request):
     return request.config.option
 
+_torch_to_cudnn_type = {
+    torch.float16: cudnn.data_type.HALF,
+    torch.bfloat16: cudnn.data_type.BFLOAT16,
+    torch.float32: cudnn.data_type.FLOAT,
+    torch.int32: cudnn.data_type.INT32,
+    torch.int64: cudnn.data_type.INT64,
+}
+
 def convert_to_cudnn_type(torch_type):
-    if torch_type == torch.float16:
-        return cudnn.data_type.HALF
-    elif torch_type == torch.bfloat16:
-        return cudnn.data_type.BFLOAT16
-    elif torch_type == torch.float32:
-        return cudnn.data_type.FLOAT
-    elif torch_type == torch.int32:
-        return cudnn.data_type.INT32
-    elif torch_type == torch.int64:
-        return cudnn.data_type.INT64
-    else:
+    if torch_type not in _torch_to_cudnn_type:
         raise ValueError("Unsupported tensor data type.")
+    return _torch_to_cudnn_type[torch_type]
 
 
 def compute_ref(